@@ -12,11 +12,11 @@ This agent:
 """
 
 from typing import List, Dict
-from datetime import datetime, timezone
 import random
 
 from base_agent import BaseAgent
 from models import (
+    utcnow,
     AnalyticsRequest,
     ROIReport,
     MediaPickup,
@@ -118,7 +118,7 @@ class AnalyticsAgent(BaseAgent[AnalyticsRequest, ROIReport]):
             audience_demographics=demographics,
             key_insights=insights,
             recommendations=recommendations,
-            analyzed_at=datetime.now(timezone.utc),
+            analyzed_at=utcnow(),
             hours_since_deployment=request.hours_since_deployment,
         )
     
@@ -163,7 +163,7 @@ class AnalyticsAgent(BaseAgent[AnalyticsRequest, ROIReport]):
             
             # Simulate publication time (spread over hours)
             hours_ago = random.randint(1, hours_elapsed)
-            published_at = datetime.now(timezone.utc)  # Would subtract hours in production
+            published_at = utcnow()  # Would subtract hours in production
             
             pickups.append(MediaPickup(
                 outlet_name=outlet_name,
@@ -12,10 +12,10 @@ This agent:
 """
 
 from typing import List, Dict, Tuple
-from datetime import datetime, timezone
 
 from base_agent import BaseAgent
 from models import (
+    utcnow,
     ChannelRoutingRequest,
     ChannelMix,
     ChannelAllocation,
@@ -175,7 +175,7 @@ class ChannelRouterAgent(BaseAgent[ChannelRoutingRequest, ChannelMix]):
             timing_recommendations=timing,
             risk_factors=risks,
             confidence_score=confidence,
-            created_at=datetime.now(timezone.utc),
+            created_at=utcnow(),
         )
     
     def _filter_channels_by_compliance(
@@ -12,10 +12,10 @@ This agent ensures news distribution meets:
 """
 
 from typing import List, Dict
-from datetime import datetime, timezone
 
 from base_agent import BaseAgent
 from models import (
+    utcnow,
     ComplianceCheckRequest,
     ComplianceReport,
     ComplianceIssue,
@@ -144,7 +144,7 @@ class ComplianceAgent(BaseAgent[ComplianceCheckRequest, ComplianceReport]):
                 forbidden_channels=[],
                 required_disclaimers=[],
                 requires_human_approval=False,
-                checked_at=datetime.now(timezone.utc),
+                checked_at=utcnow(),
             )
         
         # Check each requirement
@@ -238,7 +238,7 @@ class ComplianceAgent(BaseAgent[ComplianceCheckRequest, ComplianceReport]):
             required_disclaimers=list(set(required_disclaimers)),
             requires_human_approval=requires_approval,
             approval_workflow="Legal team review required" if requires_approval else None,
-            checked_at=datetime.now(timezone.utc),
+            checked_at=utcnow(),
         )
     
     async def _check_timing(
@@ -14,10 +14,10 @@ This agent:
 
 import asyncio
 from typing import List, Dict
-from datetime import datetime, timezone
 
 from base_agent import BaseAgent
 from models import (
+    utcnow,
     DeploymentRequest,
     DistributionResults,
     ChannelDeploymentResult,
@@ -60,13 +60,19 @@ class DeploymentAgent(BaseAgent[DeploymentRequest, DistributionResults]):
             "total_budget": request.channel_mix.total_allocated_budget,
         })
         
+        # One timestamp per deployment, shared by every channel result:
+        # the per-channel factories would otherwise each read the clock,
+        # and the readings differ only by simulated latency
+        deployed_at = utcnow()
+        
         # Execute all channels in parallel
         deployment_tasks = []
         for channel_alloc in request.channel_mix.channels:
             task = self._deploy_to_channel(
                 channel_alloc.channel,
                 request,
-                channel_alloc.allocated_budget
+                channel_alloc.allocated_budget,
+                deployed_at,
             )
             deployment_tasks.append(task)
         
@@ -122,14 +128,15 @@ class DeploymentAgent(BaseAgent[DeploymentRequest, DistributionResults]):
             public_urls=public_urls,
             overall_status=overall_status,
             error_summary=self._generate_error_summary(failed_results) if failed_results else None,
-            deployed_at=datetime.now(timezone.utc),
+            deployed_at=deployed_at,
         )
     
     async def _deploy_to_channel(
         self,
         channel: ChannelType,
         request: DeploymentRequest,
-        budget: float
+        budget: float,
+        deployed_at
     ) -> ChannelDeploymentResult:
         """Deploy to a specific channel"""
         
@@ -137,19 +144,19 @@ class DeploymentAgent(BaseAgent[DeploymentRequest, DistributionResults]):
         
         try:
             if channel == ChannelType.NEWSWIRE:
-                return await self._deploy_newswire(request, budget)
+                return await self._deploy_newswire(request, budget, deployed_at)
             elif channel == ChannelType.JOURNALIST_OUTREACH:
-                return await self._deploy_journalist_outreach(request, budget)
+                return await self._deploy_journalist_outreach(request, budget, deployed_at)
             elif channel == ChannelType.SOCIAL_MEDIA:
-                return await self._deploy_social_media(request, budget)
+                return await self._deploy_social_media(request, budget, deployed_at)
             elif channel == ChannelType.OWNED_MEDIA:
-                return await self._deploy_owned_media(request, budget)
+                return await self._deploy_owned_media(request, budget, deployed_at)
             elif channel == ChannelType.PAID_MEDIA:
-                return await self._deploy_paid_media(request, budget)
+                return await self._deploy_paid_media(request, budget, deployed_at)
             elif channel == ChannelType.SEO_OPTIMIZATION:
-                return await self._deploy_seo(request, budget)
+                return await self._deploy_seo(request, budget, deployed_at)
             elif channel == ChannelType.COMMUNITY:
-                return await self._deploy_community(request, budget)
+                return await self._deploy_community(request, budget, deployed_at)
             else:
                 raise ValueError(f"Unknown channel: {channel}")
                 
@@ -164,7 +171,8 @@ class DeploymentAgent(BaseAgent[DeploymentRequest, DistributionResults]):
     async def _deploy_newswire(
         self,
         request: DeploymentRequest,
-        budget: float
+        budget: float,
+        deployed_at
     ) -> ChannelDeploymentResult:
         """Deploy to newswire service (PR Newswire, Business Wire, etc.)"""
         
@@ -184,7 +192,7 @@ class DeploymentAgent(BaseAgent[DeploymentRequest, DistributionResults]):
         }
         
         # Simulated successful submission
-        submission_id = f"NW-{datetime.now(timezone.utc).timestamp():.0f}"
+        submission_id = f"NW-{deployed_at.timestamp():.0f}"
         public_url = f"https://prweb.com/releases/{submission_id}"
         
         # Estimated reach based on newswire service
@@ -198,13 +206,14 @@ class DeploymentAgent(BaseAgent[DeploymentRequest, DistributionResults]):
             submission_id=submission_id,
             url=public_url,
             reach=estimated_reach,
-            deployed_at=datetime.now(timezone.utc),
+            deployed_at=deployed_at,
         )
     
     async def _deploy_journalist_outreach(
         self,
         request: DeploymentRequest,
-        budget: float
+        budget: float,
+        deployed_at
     ) -> ChannelDeploymentResult:
         """Send personalized emails to journalists"""
         
@@ -238,7 +247,7 @@ class DeploymentAgent(BaseAgent[DeploymentRequest, DistributionResults]):
         # Calculate reach (assume ~1000 impressions per journalist)
         estimated_reach = sent_count * 1000
         
-        submission_id = f"JO-{datetime.now(timezone.utc).timestamp():.0f}"
+        submission_id = f"JO-{deployed_at.timestamp():.0f}"
         
         self.logger.info(f"Journalist outreach: {sent_count} sent, {failed_count} failed")
         
@@ -247,13 +256,14 @@ class DeploymentAgent(BaseAgent[DeploymentRequest, DistributionResults]):
             status="success",
             submission_id=submission_id,
             reach=estimated_reach,
-            deployed_at=datetime.now(timezone.utc),
+            deployed_at=deployed_at,
         )
     
     async def _deploy_social_media(
         self,
         request: DeploymentRequest,
-        budget: float
+        budget: float,
+        deployed_at
     ) -> ChannelDeploymentResult:
         """Post to social media platforms"""
         
@@ -273,14 +283,14 @@ class DeploymentAgent(BaseAgent[DeploymentRequest, DistributionResults]):
         
         for platform in platforms:
             # Simulated post URL
-            post_id = f"{platform.lower()}_{datetime.now(timezone.utc).timestamp():.0f}"
+            post_id = f"{platform.lower()}_{deployed_at.timestamp():.0f}"
             post_url = f"https://{platform.lower()}.com/post/{post_id}"
             post_urls.append(post_url)
         
         # Estimated organic reach
         estimated_reach = 10000  # Organic social media reach
         
-        submission_id = f"SM-{datetime.now(timezone.utc).timestamp():.0f}"
+        submission_id = f"SM-{deployed_at.timestamp():.0f}"
         
         self.logger.info(f"Social media posted to {len(platforms)} platforms")
         
@@ -290,13 +300,14 @@ class DeploymentAgent(BaseAgent[DeploymentRequest, DistributionResults]):
             submission_id=submission_id,
             url=post_urls[0] if post_urls else None,
             reach=estimated_reach,
-            deployed_at=datetime.now(timezone.utc),
+            deployed_at=deployed_at,
         )
     
     async def _deploy_owned_media(
         self,
         request: DeploymentRequest,
-        budget: float
+        budget: float,
+        deployed_at
     ) -> ChannelDeploymentResult:
         """Publish to company blog/website"""
         
@@ -308,13 +319,13 @@ class DeploymentAgent(BaseAgent[DeploymentRequest, DistributionResults]):
         await asyncio.sleep(0.2)
         
         # Simulated blog post
-        post_id = f"blog-{datetime.now(timezone.utc).timestamp():.0f}"
+        post_id = f"blog-{deployed_at.timestamp():.0f}"
         blog_url = f"https://company.com/blog/{post_id}"
         
         # Owned media reach (existing audience)
         estimated_reach = 5000
         
-        submission_id = f"OM-{datetime.now(timezone.utc).timestamp():.0f}"
+        submission_id = f"OM-{deployed_at.timestamp():.0f}"
         
         self.logger.info(f"Owned media published: {blog_url}")
         
@@ -324,13 +335,14 @@ class DeploymentAgent(BaseAgent[DeploymentRequest, DistributionResults]):
             submission_id=submission_id,
             url=blog_url,
             reach=estimated_reach,
-            deployed_at=datetime.now(timezone.utc),
+            deployed_at=deployed_at,
         )
     
     async def _deploy_paid_media(
         self,
         request: DeploymentRequest,
-        budget: float
+        budget: float,
+        deployed_at
     ) -> ChannelDeploymentResult:
         """Launch paid advertising campaign"""
         
@@ -342,7 +354,7 @@ class DeploymentAgent(BaseAgent[DeploymentRequest, DistributionResults]):
         await asyncio.sleep(0.4)
         
         # Simulate campaign creation
-        campaign_id = f"PD-{datetime.now(timezone.utc).timestamp():.0f}"
+        campaign_id = f"PD-{deployed_at.timestamp():.0f}"
         
         # Paid reach based on budget (assume $10 CPM)
         estimated_reach = int(budget * 100)  # $10 per 1000 impressions
@@ -354,13 +366,14 @@ class DeploymentAgent(BaseAgent[DeploymentRequest, DistributionResults]):
             status="success",
             submission_id=campaign_id,
             reach=estimated_reach,
-            deployed_at=datetime.now(timezone.utc),
+            deployed_at=deployed_at,
         )
     
     async def _deploy_seo(
         self,
         request: DeploymentRequest,
-        budget: float
+        budget: float,
+        deployed_at
     ) -> ChannelDeploymentResult:
         """Implement SEO optimization"""
         
@@ -375,7 +388,7 @@ class DeploymentAgent(BaseAgent[DeploymentRequest, DistributionResults]):
         await asyncio.sleep(0.2)
         
         # Simulate SEO implementation
-        seo_id = f"SEO-{datetime.now(timezone.utc).timestamp():.0f}"
+        seo_id = f"SEO-{deployed_at.timestamp():.0f}"
         
         # SEO has long-term reach (estimate 30-day reach)
         estimated_reach = int(budget * 200)  # Good long-term value
@@ -387,13 +400,14 @@ class DeploymentAgent(BaseAgent[DeploymentRequest, DistributionResults]):
             status="success",
             submission_id=seo_id,
             reach=estimated_reach,
-            deployed_at=datetime.now(timezone.utc),
+            deployed_at=deployed_at,
         )
     
     async def _deploy_community(
         self,
         request: DeploymentRequest,
-        budget: float
+        budget: float,
+        deployed_at
     ) -> ChannelDeploymentResult:
         """Post to community platforms (Reddit, HackerNews, etc.)"""
         
@@ -405,7 +419,7 @@ class DeploymentAgent(BaseAgent[DeploymentRequest, DistributionResults]):
         await asyncio.sleep(0.3)
         
         # Simulate community posts
-        post_id = f"COMM-{datetime.now(timezone.utc).timestamp():.0f}"
+        post_id = f"COMM-{deployed_at.timestamp():.0f}"
         post_url = f"https://reddit.com/r/technology/{post_id}"
         
         # Community reach varies widely
@@ -419,7 +433,7 @@ class DeploymentAgent(BaseAgent[DeploymentRequest, DistributionResults]):
             submission_id=post_id,
             url=post_url,
             reach=estimated_reach,
-            deployed_at=datetime.now(timezone.utc),
+            deployed_at=deployed_at,
         )
     
     def _generate_error_summary(self, failed_results: List[ChannelDeploymentResult]) -> str:
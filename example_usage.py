@@ -4,8 +4,7 @@ Demonstrates how to use the orchestrator agent system
 """
 
 import asyncio
-from datetime import datetime, timezone
-from uuid import uuid4
+import time
 
 from models import (
     DistributionRequest,
@@ -237,14 +236,13 @@ async def example_batch_distribution():
     
     # Execute in parallel
     print(f"🚀 Processing {len(requests)} distributions in parallel...")
-    start_time = datetime.now(timezone.utc)
-    
+    start_time = time.perf_counter()
+
     results = await asyncio.gather(
         *[orchestrator.execute(req) for req in requests]
     )
-    
-    end_time = datetime.now(timezone.utc)
-    duration = (end_time - start_time).total_seconds()
+
+    duration = time.perf_counter() - start_time
     
     print(f"\n✅ All distributions completed in {duration:.2f}s")
     print(f"📊 Success rate: {sum(1 for r in results if r.status == 'completed')}/{len(results)}")
@@ -10,12 +10,18 @@ This agent:
 5. Predicts response likelihood
 """
 
+import asyncio
+import functools
+import pickle
 from typing import List, Dict, Tuple
-from datetime import datetime, timezone
+from pathlib import Path
 import random
 
+import numpy as np
+
 from base_agent import BaseAgent
 from models import (
+    utcnow,
     JournalistTargetingRequest,
     JournalistTargetingResult,
     JournalistTarget,
@@ -23,6 +29,194 @@ from models import (
 )
 
 
+# On-disk cache for the (deterministic) mock journalist database, so the
+# build cost is paid once instead of on every process start
+_JOURNALIST_DB_CACHE = Path("~/.cache/universalnews/journalists.pkl").expanduser()
+
+
+def _build_journalist_database() -> List[Dict]:
+    """Build the mock journalist database (deterministic)"""
+
+    # In production, this would query external journalist databases
+    # For now, we'll create realistic mock data
+    rng = random.Random(1337)  # Fixed seed so the disk cache stays valid
+
+    journalists = [
+        {
+            'id': 'j001',
+            'name': 'Sarah Chen',
+            'email': 'schen@techcrunch.com',
+            'outlet': 'TechCrunch',
+            'beat': ['artificial intelligence', 'machine learning', 'startups', 'enterprise software'],
+            'industries': [IndustryCategory.TECHNOLOGY],
+            'engagement_rate': 0.35,
+        },
+        {
+            'id': 'j002',
+            'name': 'Michael Rodriguez',
+            'email': 'mrodriguez@bloomberg.com',
+            'outlet': 'Bloomberg',
+            'beat': ['finance', 'venture capital', 'ipos', 'markets'],
+            'industries': [IndustryCategory.FINANCE, IndustryCategory.TECHNOLOGY],
+            'engagement_rate': 0.28,
+        },
+        {
+            'id': 'j003',
+            'name': 'Emily Watson',
+            'email': 'ewatson@theverge.com',
+            'outlet': 'The Verge',
+            'beat': ['consumer tech', 'ai', 'product launches', 'reviews'],
+            'industries': [IndustryCategory.TECHNOLOGY],
+            'engagement_rate': 0.42,
+        },
+        {
+            'id': 'j004',
+            'name': 'David Kim',
+            'email': 'dkim@wsj.com',
+            'outlet': 'Wall Street Journal',
+            'beat': ['enterprise', 'cloud computing', 'cybersecurity', 'business technology'],
+            'industries': [IndustryCategory.TECHNOLOGY, IndustryCategory.FINANCE],
+            'engagement_rate': 0.31,
+        },
+        {
+            'id': 'j005',
+            'name': 'Jessica Martinez',
+            'email': 'jmartinez@forbes.com',
+            'outlet': 'Forbes',
+            'beat': ['startups', 'entrepreneurship', 'funding', 'innovation'],
+            'industries': [IndustryCategory.TECHNOLOGY, IndustryCategory.FINANCE],
+            'engagement_rate': 0.38,
+        },
+        {
+            'id': 'j006',
+            'name': 'Robert Thompson',
+            'email': 'rthompson@reuters.com',
+            'outlet': 'Reuters',
+            'beat': ['breaking news', 'technology', 'corporate', 'announcements'],
+            'industries': [IndustryCategory.TECHNOLOGY],
+            'engagement_rate': 0.25,
+        },
+        {
+            'id': 'j007',
+            'name': 'Amanda Foster',
+            'email': 'afoster@wired.com',
+            'outlet': 'Wired',
+            'beat': ['emerging tech', 'ai ethics', 'future of work', 'digital transformation'],
+            'industries': [IndustryCategory.TECHNOLOGY],
+            'engagement_rate': 0.33,
+        },
+        {
+            'id': 'j008',
+            'name': 'James Wilson',
+            'email': 'jwilson@ft.com',
+            'outlet': 'Financial Times',
+            'beat': ['fintech', 'banking', 'payments', 'financial services'],
+            'industries': [IndustryCategory.FINANCE],
+            'engagement_rate': 0.29,
+        },
+        {
+            'id': 'j009',
+            'name': 'Lisa Anderson',
+            'email': 'landerson@businessinsider.com',
+            'outlet': 'Business Insider',
+            'beat': ['tech industry', 'startups', 'leadership', 'strategy'],
+            'industries': [IndustryCategory.TECHNOLOGY, IndustryCategory.FINANCE],
+            'engagement_rate': 0.36,
+        },
+        {
+            'id': 'j010',
+            'name': 'Christopher Lee',
+            'email': 'clee@zdnet.com',
+            'outlet': 'ZDNet',
+            'beat': ['enterprise tech', 'cloud', 'saas', 'it infrastructure'],
+            'industries': [IndustryCategory.TECHNOLOGY],
+            'engagement_rate': 0.27,
+        },
+    ]
+    
+    # Generate more journalists programmatically
+    for i in range(11, 101):
+        journalists.append({
+            'id': f'j{i:03d}',
+            'name': f'Journalist {i}',
+            'email': f'journalist{i}@newsoutlet.com',
+            'outlet': rng.choice(['TechInsider', 'NewsWire', 'Industry Daily']),
+            'beat': rng.sample(['technology', 'business', 'innovation', 'startups'], k=2),
+            'industries': [rng.choice(list(IndustryCategory))],
+            'engagement_rate': round(rng.uniform(0.15, 0.45), 2),
+        })
+    
+    return journalists
+
+
+@functools.cache
+def _load_journalist_database() -> List[Dict]:
+    """Load the journalist database from the disk cache, building it once"""
+    if _JOURNALIST_DB_CACHE.exists():
+        try:
+            with _JOURNALIST_DB_CACHE.open('rb') as f:
+                return pickle.load(f)
+        except (pickle.PickleError, EOFError, OSError):
+            pass  # Corrupt or unreadable cache - rebuild below
+
+    journalists = _build_journalist_database()
+
+    try:
+        _JOURNALIST_DB_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        with _JOURNALIST_DB_CACHE.open('wb') as f:
+            pickle.dump(journalists, f)
+    except OSError:
+        pass  # Cache directory not writable - still usable in-memory
+
+    return journalists
+
+
+# Static portions of the batch pitch prompt - the prefix is rendered once
+# per request, only the journalist block changes between batches
+_PITCH_PROMPT_PREFIX = """Generate personalized email pitches for these journalists.
+
+News Content:
+- Industry: {industry}
+- Topics: {topics}
+- Summary: {summary}
+- Newsworthiness: {newsworthiness:.2f}
+
+Journalists:
+"""
+
+_PITCH_PROMPT_SUFFIX = """
+
+For each journalist, generate:
+1. Personalized subject line (8-12 words, compelling)
+2. Email pitch (2-3 paragraphs, professional)
+3. Why this story is relevant to their beat
+
+Return JSON:
+{
+    "pitches": [
+        {
+            "journalist_name": "Name",
+            "subject": "Subject line",
+            "pitch": "Email body",
+            "relevance_explanation": "Why relevant"
+        }
+    ]
+}"""
+
+
+# Fallback pitch template, shared across all journalists - filled per call
+# instead of rebuilding the full body from f-strings every time
+_SIMPLE_PITCH_TEMPLATE = """Hi {name},
+
+I wanted to share a story that aligns with your coverage of {beats}.
+
+{summary}
+
+I think this would resonate with {outlet}'s audience. Would you be interested in learning more?
+
+Best regards"""
+
+
 class JournalistTargetingAgent(BaseAgent[JournalistTargetingRequest, JournalistTargetingResult]):
     """
     Targets journalists with personalized pitches
@@ -40,119 +234,34 @@ class JournalistTargetingAgent(BaseAgent[JournalistTargetingRequest, JournalistT
         
         # Simulated journalist database (in production, would use Meltwater/Cision API)
         self.journalist_database = self._initialize_journalist_database()
-    
+
+        # Columnar (SoA) index over the database for vectorized filtering.
+        # Full dict rows are only materialized for final JournalistTarget construction.
+        self._build_columnar_index()
+
+        # In-flight pitch batches keyed by (industry, topics, journalist ids).
+        # Concurrent execute() calls with overlapping targets share one LLM call.
+        self._inflight: Dict[Tuple, asyncio.Task] = {}
+
+    def _build_columnar_index(self):
+        """Build structure-of-arrays index over the journalist database"""
+        db = self.journalist_database
+        industries = list(IndustryCategory)
+        self._industry_index = {ind: i for i, ind in enumerate(industries)}
+
+        self.j_ids = np.array([j['id'] for j in db])
+        self.j_engagement = np.array([j['engagement_rate'] for j in db], dtype=np.float32)
+        self.j_beat_text = np.array([' '.join(j['beat']).lower() for j in db])
+
+        # Boolean membership matrix: row = journalist, column = industry
+        self.j_industry_matrix = np.zeros((len(db), len(industries)), dtype=bool)
+        for row, journalist in enumerate(db):
+            for industry in journalist['industries']:
+                self.j_industry_matrix[row, self._industry_index[industry]] = True
+
     def _initialize_journalist_database(self) -> List[Dict]:
-        """Initialize journalist database (mock data)"""
-        
-        # In production, this would query external journalist databases
-        # For now, we'll create realistic mock data
-        
-        journalists = [
-            {
-                'id': 'j001',
-                'name': 'Sarah Chen',
-                'email': 'schen@techcrunch.com',
-                'outlet': 'TechCrunch',
-                'beat': ['artificial intelligence', 'machine learning', 'startups', 'enterprise software'],
-                'industries': [IndustryCategory.TECHNOLOGY],
-                'engagement_rate': 0.35,
-            },
-            {
-                'id': 'j002',
-                'name': 'Michael Rodriguez',
-                'email': 'mrodriguez@bloomberg.com',
-                'outlet': 'Bloomberg',
-                'beat': ['finance', 'venture capital', 'ipos', 'markets'],
-                'industries': [IndustryCategory.FINANCE, IndustryCategory.TECHNOLOGY],
-                'engagement_rate': 0.28,
-            },
-            {
-                'id': 'j003',
-                'name': 'Emily Watson',
-                'email': 'ewatson@theverge.com',
-                'outlet': 'The Verge',
-                'beat': ['consumer tech', 'ai', 'product launches', 'reviews'],
-                'industries': [IndustryCategory.TECHNOLOGY],
-                'engagement_rate': 0.42,
-            },
-            {
-                'id': 'j004',
-                'name': 'David Kim',
-                'email': 'dkim@wsj.com',
-                'outlet': 'Wall Street Journal',
-                'beat': ['enterprise', 'cloud computing', 'cybersecurity', 'business technology'],
-                'industries': [IndustryCategory.TECHNOLOGY, IndustryCategory.FINANCE],
-                'engagement_rate': 0.31,
-            },
-            {
-                'id': 'j005',
-                'name': 'Jessica Martinez',
-                'email': 'jmartinez@forbes.com',
-                'outlet': 'Forbes',
-                'beat': ['startups', 'entrepreneurship', 'funding', 'innovation'],
-                'industries': [IndustryCategory.TECHNOLOGY, IndustryCategory.FINANCE],
-                'engagement_rate': 0.38,
-            },
-            {
-                'id': 'j006',
-                'name': 'Robert Thompson',
-                'email': 'rthompson@reuters.com',
-                'outlet': 'Reuters',
-                'beat': ['breaking news', 'technology', 'corporate', 'announcements'],
-                'industries': [IndustryCategory.TECHNOLOGY],
-                'engagement_rate': 0.25,
-            },
-            {
-                'id': 'j007',
-                'name': 'Amanda Foster',
-                'email': 'afoster@wired.com',
-                'outlet': 'Wired',
-                'beat': ['emerging tech', 'ai ethics', 'future of work', 'digital transformation'],
-                'industries': [IndustryCategory.TECHNOLOGY],
-                'engagement_rate': 0.33,
-            },
-            {
-                'id': 'j008',
-                'name': 'James Wilson',
-                'email': 'jwilson@ft.com',
-                'outlet': 'Financial Times',
-                'beat': ['fintech', 'banking', 'payments', 'financial services'],
-                'industries': [IndustryCategory.FINANCE],
-                'engagement_rate': 0.29,
-            },
-            {
-                'id': 'j009',
-                'name': 'Lisa Anderson',
-                'email': 'landerson@businessinsider.com',
-                'outlet': 'Business Insider',
-                'beat': ['tech industry', 'startups', 'leadership', 'strategy'],
-                'industries': [IndustryCategory.TECHNOLOGY, IndustryCategory.FINANCE],
-                'engagement_rate': 0.36,
-            },
-            {
-                'id': 'j010',
-                'name': 'Christopher Lee',
-                'email': 'clee@zdnet.com',
-                'outlet': 'ZDNet',
-                'beat': ['enterprise tech', 'cloud', 'saas', 'it infrastructure'],
-                'industries': [IndustryCategory.TECHNOLOGY],
-                'engagement_rate': 0.27,
-            },
-        ]
-        
-        # Generate more journalists programmatically
-        for i in range(11, 101):
-            journalists.append({
-                'id': f'j{i:03d}',
-                'name': f'Journalist {i}',
-                'email': f'journalist{i}@newsoutlet.com',
-                'outlet': random.choice(['TechInsider', 'NewsWire', 'Industry Daily']),
-                'beat': random.sample(['technology', 'business', 'innovation', 'startups'], k=2),
-                'industries': [random.choice(list(IndustryCategory))],
-                'engagement_rate': round(random.uniform(0.15, 0.45), 2),
-            })
-        
-        return journalists
+        """Initialize journalist database (mock data, disk-cached)"""
+        return _load_journalist_database()
     
     async def process(self, request: JournalistTargetingRequest) -> JournalistTargetingResult:
         """
@@ -188,7 +297,17 @@ class JournalistTargetingAgent(BaseAgent[JournalistTargetingRequest, JournalistT
             request.budget_allocation
         )
         self.log_reasoning(f"Selected {len(selected)} target journalists")
-        
+
+        # Nothing selected (e.g. zero budget) - skip pitch generation entirely
+        if not selected:
+            return JournalistTargetingResult(
+                distribution_id=request.distribution_id,
+                targets=[],
+                average_relevance_score=0.0,
+                strategy_notes="No journalists targeted",
+                created_at=utcnow(),
+            )
+
         # Step 4: Generate personalized pitches
         targets = await self._generate_pitches(
             selected,
@@ -205,31 +324,29 @@ class JournalistTargetingAgent(BaseAgent[JournalistTargetingRequest, JournalistT
         return JournalistTargetingResult(
             distribution_id=request.distribution_id,
             targets=targets,
-            total_targets=len(targets),
             average_relevance_score=avg_relevance,
             strategy_notes=strategy_notes,
-            created_at=datetime.now(timezone.utc),
+            created_at=utcnow(),
         )
     
     def _discover_journalists(self, content_analysis) -> List[Dict]:
         """Discover journalists matching the content"""
-        
+
+        # Vectorized industry filter over the columnar index
+        industry_mask = self.j_industry_matrix[:, self._industry_index[content_analysis.primary_industry]]
+        candidate_idx = np.nonzero(industry_mask)[0]
+
+        # Vectorized beat/topic overlap check on the remaining rows
+        beat_text = self.j_beat_text[candidate_idx]
+        overlap_mask = np.zeros(len(candidate_idx), dtype=bool)
+        for topic in content_analysis.topics:
+            overlap_mask |= np.char.find(beat_text, topic.lower()) >= 0
+
         candidates = []
-        
-        for journalist in self.journalist_database:
-            # Filter by industry
-            if content_analysis.primary_industry not in journalist['industries']:
-                continue
-            
-            # Check beat overlap with topics
-            beat_overlap = any(
-                topic.lower() in ' '.join(journalist['beat']).lower()
-                for topic in content_analysis.topics
-            )
-            
+        for idx, beat_overlap in zip(candidate_idx, overlap_mask):
             if beat_overlap or len(candidates) < 50:  # Ensure minimum candidates
-                candidates.append(journalist)
-        
+                candidates.append(self.journalist_database[idx])
+
         return candidates
     
     async def _score_relevance(
@@ -276,15 +393,17 @@ class JournalistTargetingAgent(BaseAgent[JournalistTargetingRequest, JournalistT
         budget: float
     ) -> List[Tuple[Dict, float]]:
         """Select top N journalists within budget"""
-        
+
+        # No budget or no requested targets: nothing downstream to do
+        if budget <= 0 or target_count <= 0:
+            return []
+
         # Cost per journalist outreach (email infrastructure, tracking, etc.)
         cost_per_journalist = 6.0  # $6 per personalized outreach
-        
-        max_affordable = int(budget / cost_per_journalist) if budget > 0 else target_count
-        
+
         # Select min of requested count or affordable count
-        actual_count = min(target_count, max_affordable, len(scored_candidates))
-        
+        actual_count = min(target_count, int(budget // cost_per_journalist), len(scored_candidates))
+
         return scored_candidates[:actual_count]
     
     async def _generate_pitches(
@@ -304,14 +423,24 @@ class JournalistTargetingAgent(BaseAgent[JournalistTargetingRequest, JournalistT
             'newsworthiness': content_analysis.newsworthiness_score,
             'summary': content_analysis.analysis_summary,
         }
-        
+
+        # Render the static prompt prefix once - batches only append journalists
+        prompt_prefix = _PITCH_PROMPT_PREFIX.format(
+            industry=content_summary['industry'],
+            topics=', '.join(content_summary['topics']),
+            summary=content_summary['summary'],
+            newsworthiness=content_summary['newsworthiness'],
+        )
+
         # Generate pitches in batch (for efficiency, we'll do 3 at a time)
         batch_size = 3
         for i in range(0, len(selected), batch_size):
             batch = selected[i:i+batch_size]
-            
+
             try:
-                batch_targets = await self._generate_pitch_batch(batch, content_summary)
+                batch_targets = await self._generate_pitch_batch_coalesced(
+                    batch, content_summary, prompt_prefix
+                )
                 targets.extend(batch_targets)
             except Exception as e:
                 self.logger.warning(f"Batch pitch generation failed: {e}")
@@ -321,13 +450,40 @@ class JournalistTargetingAgent(BaseAgent[JournalistTargetingRequest, JournalistT
         
         return targets
     
+    async def _generate_pitch_batch_coalesced(
+        self,
+        batch: List[Tuple[Dict, float]],
+        content_summary: Dict,
+        prompt_prefix: str
+    ) -> List[JournalistTarget]:
+        """
+        Generate a pitch batch, coalescing duplicate in-flight requests
+
+        When concurrent execute() calls (e.g. batch distribution via
+        asyncio.gather) produce the same (industry, topics, journalists)
+        batch, only the first fires an LLM call - the rest await its result.
+        """
+        key = (
+            content_summary['industry'],
+            tuple(content_summary['topics'][:3]),
+            tuple(journalist['id'] for journalist, _ in batch),
+        )
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._generate_pitch_batch(batch, prompt_prefix))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+
+        return await task
+
     async def _generate_pitch_batch(
         self,
         batch: List[Tuple[Dict, float]],
-        content_summary: Dict
+        prompt_prefix: str
     ) -> List[JournalistTarget]:
         """Generate pitches for a batch of journalists using LLM"""
-        
+
         # Build journalist profiles
         journalist_profiles = []
         for journalist, score in batch:
@@ -336,34 +492,12 @@ class JournalistTargetingAgent(BaseAgent[JournalistTargetingRequest, JournalistT
                 'outlet': journalist['outlet'],
                 'beat': journalist['beat'],
             })
-        
-        prompt = f"""Generate personalized email pitches for these journalists.
-
-News Content:
-- Industry: {content_summary['industry']}
-- Topics: {', '.join(content_summary['topics'])}
-- Summary: {content_summary['summary']}
-- Newsworthiness: {content_summary['newsworthiness']:.2f}
-
-Journalists:
-{self._format_journalists_for_llm(journalist_profiles)}
-
-For each journalist, generate:
-1. Personalized subject line (8-12 words, compelling)
-2. Email pitch (2-3 paragraphs, professional)
-3. Why this story is relevant to their beat
 
-Return JSON:
-{{
-    "pitches": [
-        {{
-            "journalist_name": "Name",
-            "subject": "Subject line",
-            "pitch": "Email body",
-            "relevance_explanation": "Why relevant"
-        }}
-    ]
-}}"""
+        prompt = (
+            prompt_prefix
+            + self._format_journalists_for_llm(journalist_profiles)
+            + _PITCH_PROMPT_SUFFIX
+        )
 
         try:
             response = await self.call_llm_json(prompt)
@@ -406,20 +540,19 @@ Return JSON:
         content_analysis
     ) -> JournalistTarget:
         """Generate simple pitch (fallback)"""
-        
-        subject = f"Story Opportunity: {content_analysis.primary_industry.value.title()} - {content_analysis.topics[0] if content_analysis.topics else 'Update'}"
-        
-        pitch = f"""Hi {journalist['name']},
 
-I wanted to share a story that aligns with your coverage of {', '.join(journalist['beat'][:2])}.
+        beats = ', '.join(journalist['beat'][:2])
 
-{content_analysis.analysis_summary}
+        subject = f"Story Opportunity: {content_analysis.primary_industry.value.title()} - {content_analysis.topics[0] if content_analysis.topics else 'Update'}"
 
-I think this would resonate with {journalist['outlet']}'s audience. Would you be interested in learning more?
+        pitch = _SIMPLE_PITCH_TEMPLATE.format(
+            name=journalist['name'],
+            beats=beats,
+            summary=content_analysis.analysis_summary,
+            outlet=journalist['outlet'],
+        )
 
-Best regards"""
-        
-        why_relevant = f"Matches {journalist['name']}'s beat: {', '.join(journalist['beat'][:2])}"
+        why_relevant = f"Matches {journalist['name']}'s beat: {beats}"
         
         return JournalistTarget(
             journalist_id=journalist['id'],